@@ -19,18 +19,55 @@ Run with: uv run agent_realtime_vision.py dev
 Required: Set GOOGLE_API_KEY and EXA_API_KEY in your .env.local file
 """
 
+import asyncio
+import contextlib
+import functools
+import logging
 import os
+import re
+import threading
+import time
+import warnings
+from collections import OrderedDict
+
+import aiohttp
+import numpy as np
 from dotenv import load_dotenv
 
 from livekit import agents, rtc
 from livekit.agents import AgentServer, AgentSession, Agent, room_io, mcp, function_tool, RunContext
+from livekit.agents.utils import images
+from livekit.agents.voice import VoiceActivityVideoSampler, io
+from livekit.agents.voice.room_io.types import NoiseCancellationParams
+# Imported up front on purpose - LiveKit plugins must register on the main thread
 from livekit.plugins import google, noise_cancellation
 
-# Import EXA
-from exa_py import Exa
+try:
+    import uvloop
+except ImportError:  # Not available on Windows
+    uvloop = None
 
 load_dotenv(".env.local")
 
+# Debug output (per search, per dropped frame) is skipped entirely unless LOG_LEVEL=DEBUG
+logger = logging.getLogger("realtime-vision-agent")
+LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO").upper()
+if LOG_LEVEL not in logging.getLevelNamesMapping():
+    logger.warning("Unknown LOG_LEVEL %r, using INFO", LOG_LEVEL)
+    LOG_LEVEL = "INFO"
+logger.setLevel(LOG_LEVEL)
+
+# Run the worker and its job processes on uvloop: everything here is socket I/O
+# (WebRTC media, the Gemini Live websocket, EXA HTTPS). Set at import so job
+# processes, which re-import this module, pick it up too.
+if uvloop is not None:
+    # Event loop policies are deprecated from Python 3.14, but the livekit CLI
+    # creates its loops with asyncio.new_event_loop(), so a policy is still the
+    # only way to swap the loop in. Silence just this warning, on every process.
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", DeprecationWarning)
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
 # =============================================================================
 # MCP SERVER CONFIGURATION
 # Set MCP_SERVER_URL in .env.local to enable tools from that server
@@ -38,36 +75,341 @@ load_dotenv(".env.local")
 # =============================================================================
 MCP_SERVER_URL = os.getenv("MCP_SERVER_URL", "")  # Load from environment
 
+# =============================================================================
+# NOISE CANCELLATION
+# Built once per worker process; picked per audio track by participant kind
+# =============================================================================
+BVC_TELEPHONY = noise_cancellation.BVCTelephony()
+BVC = noise_cancellation.BVC()
+
+
+def select_noise_cancellation(params: NoiseCancellationParams) -> rtc.NoiseCancellationOptions:
+    """Use BVCTelephony for SIP callers and BVC for everyone else."""
+    if params.participant.kind == rtc.ParticipantKind.PARTICIPANT_KIND_SIP:
+        return BVC_TELEPHONY
+    return BVC
+
+
 # =============================================================================
 # EXA SEARCH CONFIGURATION
 # =============================================================================
 EXA_API_KEY = os.getenv("EXA_API_KEY", "")
-print(f"EXA API Key loaded: {'Yes' if EXA_API_KEY else 'No'}")  # Debug logging
-
-# Test EXA connection if key is available
-if EXA_API_KEY:
-    try:
-        test_exa = Exa(api_key=EXA_API_KEY)
-        # Simple test search to verify API works
-        test_response = test_exa.search("test", num_results=1)
-        print(f"✅ EXA API test successful - found {len(test_response.results)} test results")
-    except Exception as e:
-        error_str = str(e)
-        if "402" in error_str or "credits" in error_str.lower():
-            print(f"⚠️  EXA API has insufficient credits. Visit dashboard.exa.ai to add credits.")
-        elif "401" in error_str or "unauthorized" in error_str.lower():
-            print(f"❌ EXA API key is invalid. Check your EXA_API_KEY in .env.local")
-        else:
-            print(f"❌ EXA API test failed: {error_str}")
-else:
-    print("⚠️  No EXA API key - search functionality disabled")
+EXA_SEARCH_URL = "https://api.exa.ai/search"
+EXA_NUM_RESULTS = 3  # Every result is something the model may read aloud
+EXA_SNIPPET_CHARS = 300  # Text kept per result
+logger.debug("EXA API Key loaded: %s", "Yes" if EXA_API_KEY else "No")
+
+# The key itself is checked in the background when each session starts
+if not EXA_API_KEY:
+    logger.warning("No EXA API key - search functionality disabled")
+
+EXA_CREDITS_ERROR = "EXA search is temporarily unavailable due to account credits. Please check your EXA dashboard at dashboard.exa.ai"
+EXA_AUTH_ERROR = "EXA API key is invalid. Please check your EXA_API_KEY in .env.local"
+
+
+def new_exa_http_session() -> aiohttp.ClientSession:
+    """Open a pooled HTTP session for EXA, so a job's searches reuse the TLS connection.
+
+    aiohttp sessions are bound to the event loop they were created on, so each
+    job opens its own and closes it when the job shuts down.
+    """
+    return aiohttp.ClientSession(
+        connector=aiohttp.TCPConnector(limit=4, keepalive_timeout=60),
+        headers={"x-api-key": EXA_API_KEY},
+    )
+
+
+def format_exa_result(result: dict) -> dict:
+    """Trim an EXA search result (url, title, text) down to a short voice-friendly snippet."""
+    text = result.get("text") or ""
+    return {
+        "title": result.get("title") or "Untitled",
+        "url": result.get("url") or "",
+        "snippet": text[:EXA_SNIPPET_CHARS] + "..." if len(text) > EXA_SNIPPET_CHARS else text,
+    }
+
+
+async def fetch_exa_results(http: aiohttp.ClientSession, query: str) -> list[dict]:
+    """Run an EXA search with contents and return the formatted results."""
+    logger.debug("Calling EXA API for: '%s'", query)
+
+    # Search with contents for comprehensive results, without blocking the event loop
+    async with http.post(
+        EXA_SEARCH_URL,
+        json={
+            "query": query,
+            "numResults": EXA_NUM_RESULTS,  # Limit results for voice responses
+            "type": "auto",   # Let EXA determine search type
+            # Only fetch the text we keep - one extra char tells us when it was cut
+            "contents": {"text": {"maxCharacters": EXA_SNIPPET_CHARS + 1}},
+        },
+    ) as http_response:
+        http_response.raise_for_status()
+        response = await http_response.json()
+
+    logger.debug("EXA returned %d results", len(response["results"]))
+
+    # Format results for voice response
+    return [format_exa_result(result) for result in response["results"]]
+
+
+# =============================================================================
+# EXA SEARCH CACHE
+# Users often re-ask the same question within a few minutes, so successful
+# results are kept briefly and concurrent identical searches share one request
+# =============================================================================
+EXA_CACHE_SIZE = 256
+EXA_CACHE_TTL = 300.0  # Seconds
+EXA_CACHE_TTL_TIME_SENSITIVE = 30.0  # For queries like "what's the weather now"
+TIME_SENSITIVE_WORDS = frozenset({"now", "today", "tonight", "latest", "current", "currently", "live", "breaking"})
+
+# LRU of {normalized query: (expiry time, results)}. Shared by every job in the
+# process, which may be on different threads, so it is only touched under the lock
+_exa_cache: OrderedDict[str, tuple[float, list[dict]]] = OrderedDict()
+_exa_cache_lock = threading.Lock()
+# Searches currently in flight, by (event loop, normalized query). Keyed by loop
+# because tasks can only be awaited from their own loop, and jobs may each run
+# their own loop inside one process
+_exa_inflight: dict[tuple[asyncio.AbstractEventLoop, str], asyncio.Task[list[dict]]] = {}
+
+
+def exa_cache_key(query: str) -> str:
+    """Normalize a query so trivial case/whitespace differences share a cache entry."""
+    return " ".join(query.lower().split())
+
+
+async def _fetch_and_cache_exa_results(http: aiohttp.ClientSession, key: str, query: str) -> list[dict]:
+    results = await fetch_exa_results(http, query)
+
+    # Match on bare words, so "now?" and "today's" still count
+    is_time_sensitive = not TIME_SENSITIVE_WORDS.isdisjoint(re.findall(r"[a-z]+", key))
+    ttl = EXA_CACHE_TTL_TIME_SENSITIVE if is_time_sensitive else EXA_CACHE_TTL
+    with _exa_cache_lock:
+        _exa_cache[key] = (time.monotonic() + ttl, results)
+        _exa_cache.move_to_end(key)
+        while len(_exa_cache) > EXA_CACHE_SIZE:
+            _exa_cache.popitem(last=False)
+    return results
+
+
+async def cached_exa_search(http: aiohttp.ClientSession, query: str) -> list[dict]:
+    """Search EXA, answering repeated queries from the cache when still fresh."""
+    key = exa_cache_key(query)
+
+    with _exa_cache_lock:
+        cached = _exa_cache.get(key)
+        if cached is not None:
+            if time.monotonic() < cached[0]:
+                _exa_cache.move_to_end(key)
+            else:
+                del _exa_cache[key]
+                cached = None
+
+    if cached is not None:
+        logger.debug("EXA cache hit for: '%s'", query)
+        return cached[1]
+
+    # Join an identical search that is already running instead of starting another
+    inflight_key = (asyncio.get_running_loop(), key)
+    task = _exa_inflight.get(inflight_key)
+    if task is None:
+        task = asyncio.create_task(_fetch_and_cache_exa_results(http, key, query))
+        _exa_inflight[inflight_key] = task
+
+        def on_done(task: asyncio.Task[list[dict]]) -> None:
+            _exa_inflight.pop(inflight_key, None)
+            # Mark a failure as seen, in case every caller was cancelled before it
+            if not task.cancelled():
+                task.exception()
+
+        task.add_done_callback(on_done)
+
+    # Shielded so one caller being cancelled doesn't cancel the search for the others
+    return await asyncio.shield(task)
+
+
+# =============================================================================
+# VIDEO FRAME SAMPLING
+# Only the newest camera frame is considered, and frames that are near-duplicates
+# of one recently sent to Gemini are skipped, so a static scene doesn't re-upload
+# (and re-encode) the same image every second
+# =============================================================================
+FRAME_HASH_MAX_DISTANCE = 5  # Max differing bits for two frames to count as "the same"
+FRAME_HASH_MAX_AGE = 10.0  # Seconds before an unchanged scene is sent again anyway
+
+# Frames are shrunk before upload: 384px is plenty for "what do you see" and
+# cuts JPEG size (and Gemini's per-tile vision cost) several-fold vs. 1024px
+FRAME_ENCODE_OPTIONS = images.EncodeOptions(
+    format="JPEG",
+    quality=70,
+    resize_options=images.ResizeOptions(width=384, height=384, strategy="scale_aspect_fit"),
+)
+
+
+@functools.lru_cache(maxsize=8)
+def _dhash_grid(height: int, width: int) -> tuple[np.ndarray, np.ndarray]:
+    """Row/column indices of a 32x36 sampling grid, cached per camera resolution."""
+    rows = np.linspace(0, height - 1, 32).astype(np.intp)
+    cols = np.linspace(0, width - 1, 36).astype(np.intp)
+    return np.ix_(rows, cols)
+
+
+def frame_dhash(frame: rtc.VideoFrame) -> int:
+    """Compute a 64-bit difference hash (dHash) of a video frame's luma plane."""
+    if frame.type != rtc.VideoBufferType.I420:
+        frame = frame.convert(rtc.VideoBufferType.I420)
+
+    # The Y plane of an I420 buffer is already a grayscale image
+    luma = np.frombuffer(frame.data, dtype=np.uint8, count=frame.width * frame.height)
+    luma = luma.reshape(frame.height, frame.width)
+
+    # Sample a 32x36 grid, then average 4x4 blocks down to 8x9
+    small = luma[_dhash_grid(frame.height, frame.width)].reshape(8, 4, 9, 4).mean(axis=(1, 3))
+
+    # Each bit records whether brightness increases left-to-right
+    bits = small[:, 1:] > small[:, :-1]
+    return int.from_bytes(np.packbits(bits).tobytes(), "big")
+
+
+class SceneChangeVideoSampler(VoiceActivityVideoSampler):
+    """Voice-activity frame sampler that drops frames matching a recently sent one."""
+
+    def __init__(
+        self,
+        *,
+        speaking_fps: float = 1.0,
+        silent_fps: float = 0.3,
+        max_distance: int = FRAME_HASH_MAX_DISTANCE,
+        max_age: float = FRAME_HASH_MAX_AGE,
+        cache_size: int = 8,
+    ) -> None:
+        super().__init__(speaking_fps=speaking_fps, silent_fps=silent_fps)
+        self.max_distance = max_distance
+        # The refresh window has to span a few sampling intervals, or at 0.3fps
+        # every hash has expired by the time the next frame is sampled
+        if silent_fps > 0:
+            max_age = max(max_age, 2.0 / silent_fps)
+        self.max_age = max_age
+        self.cache_size = cache_size
+        # LRU of {frame hash: time that scene was sent} - a skipped frame
+        # doesn't reset the time, so an unchanged scene is re-sent every max_age
+        self._sent_hashes: OrderedDict[int, float] = OrderedDict()
+
+    def __call__(self, frame: rtc.VideoFrame, session: AgentSession) -> bool:
+        if not super().__call__(frame, session):
+            return False
+
+        now = time.time()
+        frame_hash = frame_dhash(frame)
+
+        for sent_hash, sent_at in self._sent_hashes.items():
+            if now - sent_at >= self.max_age:
+                continue
+            if (frame_hash ^ sent_hash).bit_count() <= self.max_distance:
+                self._sent_hashes.move_to_end(sent_hash)
+                logger.debug("Skipping unchanged camera frame (hash %016x)", frame_hash)
+                return False
+
+        self._sent_hashes[frame_hash] = now
+        self._sent_hashes.move_to_end(frame_hash)
+        while len(self._sent_hashes) > self.cache_size:
+            self._sent_hashes.popitem(last=False)
+        return True
+
+
+class LatestFrameVideoInput(io.VideoInput):
+    """Video input that yields only the newest frame, dropping any backlog.
+
+    Frames are pulled from the source as fast as they arrive and kept in a
+    single slot, so a slow consumer always gets current camera content
+    instead of working through a queue of stale frames.
+    """
+
+    def __init__(self, source: io.VideoInput, *, report_interval: float = 30.0) -> None:
+        super().__init__(label="LatestFrame", source=source)
+        self.report_interval = report_interval
+        self._latest: rtc.VideoFrame | None = None
+        self._frame_ready = asyncio.Event()
+        self._pump_task: asyncio.Task | None = None
+        self._source_done = False
+        self._source_error: Exception | None = None
+        self._dropped = 0
+        self._last_report = time.monotonic()
+
+    def _start_pump(self) -> None:
+        if self._pump_task is None:
+            self._pump_task = asyncio.create_task(self._pump())
+
+    def _stop_pump(self) -> asyncio.Task | None:
+        task, self._pump_task = self._pump_task, None
+        if task is not None:
+            task.cancel()
+        self._latest = None
+        self._source_done = False
+        self._source_error = None
+        self._frame_ready.clear()
+        return task
+
+    def on_attached(self) -> None:
+        super().on_attached()
+        self._start_pump()
+
+    def on_detached(self) -> None:
+        # Stop reading the source while detached (or once replaced as the
+        # session's video input) so nothing competes with its next consumer
+        self._stop_pump()
+        super().on_detached()
+
+    async def aclose(self) -> None:
+        """Stop pulling frames from the source."""
+        task = self._stop_pump()
+        if task is not None:
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+
+    async def _pump(self) -> None:
+        try:
+            async for frame in self.source:
+                if self._latest is not None:
+                    self._dropped += 1
+                self._latest = frame
+                self._frame_ready.set()
+        except Exception as e:
+            self._source_error = e
+        # Not reached when cancelled - _stop_pump has already reset the state
+        self._source_done = True
+        self._frame_ready.set()
+
+    async def __anext__(self) -> rtc.VideoFrame:
+        self._start_pump()
+
+        await self._frame_ready.wait()
+        self._frame_ready.clear()
+
+        if self._latest is None:
+            if self._source_error is not None:
+                raise self._source_error
+            raise StopAsyncIteration
+
+        frame, self._latest = self._latest, None
+        if self._source_done:
+            # Let the next call see the end of the stream
+            self._frame_ready.set()
+
+        now = time.monotonic()
+        if self._dropped and now - self._last_report >= self.report_interval:
+            logger.debug("Dropped %d stale camera frames in the last %.0fs", self._dropped, now - self._last_report)
+            self._dropped = 0
+            self._last_report = now
+
+        return frame
 
 
 class RealtimeVisionAssistant(Agent):
     """A realtime voice and vision AI assistant using Google's Gemini Live API with EXA search."""
 
-    def __init__(self) -> None:
-        print(f"🤖 Initializing RealtimeVisionAssistant with EXA search: {'enabled' if EXA_API_KEY else 'disabled'}")
+    def __init__(self, exa_http: aiohttp.ClientSession) -> None:
+        logger.debug("Initializing RealtimeVisionAssistant with EXA search: %s", "enabled" if EXA_API_KEY else "disabled")
 
         super().__init__(
             instructions="""You are a helpful voice and vision AI assistant with realtime capabilities and web search.
@@ -96,66 +438,75 @@ class RealtimeVisionAssistant(Agent):
                 output_audio_transcription={},
                 # Enable transcription of user's audio input (may have slight delay)
                 input_audio_transcription={},
+                # Downscale camera frames before they are JPEG-encoded and uploaded
+                image_encode_options=FRAME_ENCODE_OPTIONS,
             ),
         )
 
-        print("✅ Agent initialized successfully")
+        self._exa_http = exa_http
+        self._exa_error: str | None = None
+
+        # Test EXA connection in the background, without holding up session start.
+        # Created here, on the job's own event loop, since jobs may share a process
+        self._exa_ready = asyncio.Event()
+        self._exa_probe_task: asyncio.Task | None = None
+        if EXA_API_KEY:
+            self._exa_probe_task = asyncio.create_task(self._probe_exa())
+        else:
+            self._exa_ready.set()
+
+        logger.debug("Agent initialized successfully")
+
+    async def _probe_exa(self) -> None:
+        """Run a tiny EXA search to verify the API key and account credits."""
+        try:
+            async with self._exa_http.post(
+                EXA_SEARCH_URL,
+                json={"query": "test", "numResults": 1},
+                timeout=aiohttp.ClientTimeout(total=2),
+            ) as response:
+                if response.status == 402:
+                    self._exa_error = EXA_CREDITS_ERROR
+                    logger.warning("EXA API has insufficient credits. Visit dashboard.exa.ai to add credits.")
+                elif response.status == 401:
+                    self._exa_error = EXA_AUTH_ERROR
+                    logger.error("EXA API key is invalid. Check your EXA_API_KEY in .env.local")
+                elif response.status >= 400:
+                    logger.warning("EXA API test failed: HTTP %d", response.status)
+                else:
+                    data = await response.json()
+                    logger.info("EXA API test successful - found %d test results", len(data.get("results", [])))
+        except Exception as e:
+            # Not conclusive (e.g. a slow network) - searches will report their own errors
+            logger.warning("EXA API test failed: %r", e)
+        finally:
+            self._exa_ready.set()
 
     @function_tool()
     async def exa_web_search(self, context: RunContext, query: str):
         """Search the web using EXA for real-time information and current events."""
-        print(f"🔍 EXA Search called with query: '{query}'")  # Debug logging
+        logger.debug("EXA Search called with query: '%s'", query)
 
         try:
             if not EXA_API_KEY:
-                print("❌ No EXA API key found")
+                logger.warning("No EXA API key found")
                 return {
                     "error": "EXA API key not configured",
                     "query": query
                 }
 
-            exa = Exa(api_key=EXA_API_KEY)
-            print(f"🔗 Calling EXA API for: '{query}'")
-
-            # Use search_and_contents for comprehensive results
-            response = exa.search_and_contents(
-                query=query,
-                num_results=5,  # Limit results for voice responses
-                type="auto",    # Let EXA determine search type
-                text={"max_characters": 1500}  # Reasonable limit for voice
-            )
-
-            print(f"✅ EXA returned {len(response.results)} results")
-
-            # Format results for voice response
-            results = []
-            for i, result in enumerate(response.results):
-                try:
-                    # EXA results have these attributes: url, title, text
-                    # Access them directly as attributes
-                    title = result.title if hasattr(result, 'title') else 'Untitled'
-                    url = result.url if hasattr(result, 'url') else ''
-                    text = result.text if hasattr(result, 'text') else ''
-
-                    # Clean up the text
-                    if text and len(text) > 300:
-                        text = text[:300] + "..."
-
-                    results.append({
-                        "title": title,
-                        "url": url,
-                        "snippet": text
-                    })
-                except Exception as parse_error:
-                    print(f"❌ Error parsing result {i+1}: {str(parse_error)}")
-                    # Add a fallback result
-                    results.append({
-                        "title": f"Search Result {i+1}",
-                        "url": "",
-                        "snippet": "Found relevant information but unable to parse details"
-                    })
-
-            print(f"📝 Formatted {len(results)} results for response")
+            # Only the first search can still be waiting on the startup check
+            if not self._exa_ready.is_set():
+                await self._exa_ready.wait()
+            if self._exa_error:
+                return {
+                    "error": self._exa_error,
+                    "query": query
+                }
+
+            results = await cached_exa_search(self._exa_http, query)
+
+            logger.debug("Formatted %d results for response", len(results))
             return {
                 "query": query,
                 "results": results,
@@ -164,17 +515,17 @@ class RealtimeVisionAssistant(Agent):
 
         except Exception as e:
             error_msg = str(e)
-            print(f"❌ EXA Search error: {error_msg}")
+            logger.error("EXA Search error: %s", error_msg)
 
             # Check for common error types
             if "402" in error_msg or "credits" in error_msg.lower():
                 return {
-                    "error": "EXA search is temporarily unavailable due to account credits. Please check your EXA dashboard at dashboard.exa.ai",
+                    "error": EXA_CREDITS_ERROR,
                     "query": query
                 }
             elif "401" in error_msg or "unauthorized" in error_msg.lower():
                 return {
-                    "error": "EXA API key is invalid. Please check your EXA_API_KEY in .env.local",
+                    "error": EXA_AUTH_ERROR,
                     "query": query
                 }
             else:
@@ -190,7 +541,11 @@ server = AgentServer()
 @server.rtc_session(agent_name="realtime-vision-agent")
 async def realtime_vision_agent(ctx: agents.JobContext):
     """Entry point for the realtime vision agent session."""
-    print("🚀 Starting realtime vision agent session")
+    logger.info("Starting realtime vision agent session")
+
+    # EXA connections are pooled for this job and closed when it ends
+    exa_http = new_exa_http_session()
+    ctx.add_shutdown_callback(exa_http.close)
 
     # Configure MCP servers if URL is provided
     mcp_servers = []
@@ -199,29 +554,33 @@ async def realtime_vision_agent(ctx: agents.JobContext):
 
     session = AgentSession(
         mcp_servers=mcp_servers if mcp_servers else None,
+        # Same 1fps/0.3fps sampling as the default, minus frames of an unchanged scene
+        video_sampler=SceneChangeVideoSampler(),
     )
 
-    print("📝 Agent session created, starting...")
+    logger.debug("Agent session created, starting...")
 
     await session.start(
         room=ctx.room,
-        agent=RealtimeVisionAssistant(),
+        agent=RealtimeVisionAssistant(exa_http),
         room_options=room_io.RoomOptions(
             # Enable live video input - this is the key feature!
             # The agent automatically samples frames from the user's camera
-            # Default: 1 frame/sec while speaking, 1 frame/3sec otherwise
+            # 1 frame/sec while speaking, 1 frame/3sec otherwise (see SceneChangeVideoSampler)
             video_input=True,
             audio_input=room_io.AudioInputOptions(
                 # Enhanced noise cancellation
-                noise_cancellation=lambda params: (
-                    noise_cancellation.BVCTelephony() 
-                    if params.participant.kind == rtc.ParticipantKind.PARTICIPANT_KIND_SIP 
-                    else noise_cancellation.BVC()
-                ),
+                noise_cancellation=select_noise_cancellation,
             ),
         ),
     )
 
+    # Always hand the newest camera frame to the sampler, never a queued backlog
+    if session.input.video is not None:
+        latest_frame_input = LatestFrameVideoInput(session.input.video)
+        session.input.video = latest_frame_input
+        ctx.add_shutdown_callback(latest_frame_input.aclose)
+
     # Generate initial greeting mentioning vision and search capabilities
     search_capability = " and I can search the web for current information" if EXA_API_KEY else ""
     await session.generate_reply(
@@ -9,16 +9,33 @@ This agent uses a traditional voice pipeline with:
 Run with: uv run agent_voice.py dev
 """
 
+import asyncio
 import os
+import warnings
 from dotenv import load_dotenv
 
 from livekit import agents, rtc
-from livekit.agents import AgentServer, AgentSession, Agent, room_io, mcp
+from livekit.agents import AgentServer, AgentSession, Agent, JobProcess, room_io, mcp
+from livekit.agents.voice.room_io.types import NoiseCancellationParams
+# Keep these imports at module level: the turn detector registers its inference
+# runner (and model files for `download-files`) at import, before the worker starts
 from livekit.plugins import noise_cancellation, silero
 from livekit.plugins.turn_detector.multilingual import MultilingualModel
 
+try:
+    import uvloop
+except ImportError:  # Not available on Windows
+    uvloop = None
+
 load_dotenv(".env.local")
 
+# Use uvloop for the worker and its job processes (set at import so it applies to both)
+if uvloop is not None:
+    # Policies are deprecated in Python 3.14 - see agent_realtime_vision.py
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", DeprecationWarning)
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
 # =============================================================================
 # MCP SERVER CONFIGURATION
 # Set MCP_SERVER_URL in .env.local to enable tools from that server
@@ -27,6 +44,21 @@ load_dotenv(".env.local")
 MCP_SERVER_URL = os.getenv("MCP_SERVER_URL", "")  # Load from environment
 
 
+# =============================================================================
+# NOISE CANCELLATION
+# Built once per worker process; picked per audio track by participant kind
+# =============================================================================
+BVC_TELEPHONY = noise_cancellation.BVCTelephony()
+BVC = noise_cancellation.BVC()
+
+
+def select_noise_cancellation(params: NoiseCancellationParams) -> rtc.NoiseCancellationOptions:
+    """Use BVCTelephony for SIP callers and BVC for everyone else."""
+    if params.participant.kind == rtc.ParticipantKind.PARTICIPANT_KIND_SIP:
+        return BVC_TELEPHONY
+    return BVC
+
+
 class VoiceAssistant(Agent):
     """A helpful voice AI assistant using the STT-LLM-TTS pipeline."""
     
@@ -41,7 +73,13 @@ class VoiceAssistant(Agent):
         )
 
 
+def prewarm(proc: JobProcess):
+    """Load the VAD model before a job is assigned, off the session-start path."""
+    proc.userdata["vad"] = silero.VAD.load()
+
+
 server = AgentServer()
+server.setup_fnc = prewarm
 
 
 @server.rtc_session(agent_name="voice-agent-py")
@@ -62,8 +100,9 @@ async def voice_agent(ctx: agents.JobContext):
         # Text-to-Speech: Cartesia Sonic-3
         tts="cartesia/sonic-3:9626c31c-bec5-4cca-baa8-f8ba9e84c8bc",
         # Voice Activity Detection: Silero
-        vad=silero.VAD.load(),
+        vad=ctx.proc.userdata["vad"],
         # Turn Detection: Multilingual model for natural conversation flow
+        # (needs the job's inference executor, so it's created per session)
         turn_detection=MultilingualModel(),
         # Enable TTS-aligned transcription for word-level sync (Cartesia supports this)
         use_tts_aligned_transcript=True,
@@ -76,11 +115,7 @@ async def voice_agent(ctx: agents.JobContext):
             audio_input=room_io.AudioInputOptions(
                 # Enhanced noise cancellation
                 # Use BVCTelephony for telephony applications
-                noise_cancellation=lambda params: (
-                    noise_cancellation.BVCTelephony() 
-                    if params.participant.kind == rtc.ParticipantKind.PARTICIPANT_KIND_SIP 
-                    else noise_cancellation.BVC()
-                ),
+                noise_cancellation=select_noise_cancellation,
             ),
         ),
     )